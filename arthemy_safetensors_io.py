@@ -0,0 +1,133 @@
+import json
+import math
+import os
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+# ==============================================================================
+# SAFETENSORS HEADER READER
+# Description: Metadata-only access to .safetensors files.
+# ==============================================================================
+def read_header(path):
+    """
+    Reads only the JSON header at the start of a .safetensors file.
+
+    Returns (header, metadata): 'header' maps every tensor name to its
+    dtype / shape / data_offsets entry, 'metadata' is the optional
+    "__metadata__" dict ({} when absent). The tensor data is never touched,
+    so this costs two small reads regardless of the file size.
+    """
+    with open(path, "rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size).decode("utf-8"))
+    metadata = header.pop("__metadata__", None) or {}
+    return header, metadata
+
+
+# ==============================================================================
+# SAFETENSORS STREAMING WRITER
+# Description: Writes .safetensors files one tensor at a time.
+# ==============================================================================
+# safetensors dtype tags for every torch dtype the savers can produce
+_DTYPE_TAGS = {
+    torch.float64: "F64",
+    torch.float32: "F32",
+    torch.float16: "F16",
+    torch.bfloat16: "BF16",
+    torch.int64: "I64",
+    torch.int32: "I32",
+    torch.int16: "I16",
+    torch.int8: "I8",
+    torch.uint8: "U8",
+    torch.bool: "BOOL",
+}
+if hasattr(torch, "float8_e4m3fn"):
+    _DTYPE_TAGS[torch.float8_e4m3fn] = "F8_E4M3"
+    _DTYPE_TAGS[torch.float8_e5m2] = "F8_E5M2"
+
+
+def save_file_streamed(path, specs, tensors, metadata=None):
+    """
+    Writes a .safetensors file without holding the whole state dict in memory.
+
+    Layout: [8-byte little-endian header size][JSON header][tensor bytes].
+    - 'specs' is the ordered list of (name, shape, dtype) entries; it is used to
+      compute every offset and write the header before any tensor exists.
+    - 'tensors' yields (name, tensor) pairs in the same order; each tensor is
+      written as soon as it arrives and can be freed right after.
+
+    The file is written next to 'path' and moved into place only once complete,
+    so a failed export never leaves a truncated model behind.
+    """
+    header = {}
+    if metadata:
+        header["__metadata__"] = {str(k): str(v) for k, v in metadata.items()}
+
+    offset = 0
+    for name, shape, dtype in specs:
+        nbytes = math.prod(shape) * torch.empty((), dtype=dtype).element_size()
+        header[name] = {
+            "dtype": _DTYPE_TAGS[dtype],
+            "shape": list(shape),
+            "data_offsets": [offset, offset + nbytes],
+        }
+        offset += nbytes
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Pad the header with spaces so the tensor data starts 8-byte aligned
+    header_bytes += b" " * (-len(header_bytes) % 8)
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack("<Q", len(header_bytes)))
+            f.write(header_bytes)
+
+            expected = iter(specs)
+            for name, tensor in tensors:
+                spec_name, shape, dtype = next(expected)
+                if name != spec_name or tuple(tensor.shape) != tuple(shape) or tensor.dtype != dtype:
+                    raise ValueError(f"Tensor '{name}' does not match the planned header entry '{spec_name}'.")
+                # Raw bytes of the tensor (viewed as uint8, as numpy lacks bf16/fp8)
+                data = tensor.detach().to("cpu").contiguous().reshape(-1).view(torch.uint8)
+                f.write(memoryview(data.numpy()))
+                del data, tensor
+
+            if next(expected, None) is not None:
+                raise ValueError("Fewer tensors were produced than planned in the header.")
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ==============================================================================
+# ORDERED PARALLEL MAP
+# Description: Bounded ThreadPoolExecutor.map for producer/consumer pipelines.
+# ==============================================================================
+# Default worker cap: every in-flight result is a full tensor (an FP32 copy in the
+# Qwen saver), so scaling with cpu_count() would let RAM grow with the core count.
+STREAM_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def map_in_order(fn, items, max_workers=None):
+    """
+    Like ThreadPoolExecutor.map, but keeps at most 2 * max_workers results in flight
+    (running or finished, waiting for the consumer). Feeding a streaming writer this
+    way bounds peak RAM to that many tensors instead of letting every finished result
+    pile up ahead of the disk. max_workers defaults to STREAM_WORKERS.
+    """
+    max_workers = max_workers or STREAM_WORKERS
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -1,9 +1,121 @@
 import torch
-import re
 import os
 import folder_paths
-from safetensors.torch import save_file
-import safetensors
+from .arthemy_safetensors_io import read_header, save_file_streamed, map_in_order
+
+def _layer_index(key):
+    """
+    Returns the layer index of a standard Qwen key ("...layers.N." / "...h.N."),
+    or None for keys outside the layer stack.
+    Plain str.find slicing is used instead of a regex, as this runs on every key.
+    """
+    start = key.find(".layers.")
+    if start >= 0:
+        start += 8
+    else:
+        start = key.find(".h.")
+        if start < 0:
+            return None
+        start += 3
+
+    end = key.find(".", start)
+    if end < 0:
+        return None
+    digits = key[start:end]
+    return int(digits) if digits.isdecimal() else None
+
+
+def _clean_key(key):
+    """
+    Strips the ComfyUI wrapper prefix and the "model." prefix, so RAM keys
+    ("qwen3_4b.transformer.model.layers.0...") and disk keys ("model.layers.0...")
+    reduce to the same suffix. removeprefix only checks the start of the key and
+    returns it unchanged (no new string) when the prefix is absent.
+    """
+    return key.removeprefix("qwen3_4b.transformer.").removeprefix("model.")
+
+
+def _layer_key_index(model_obj):
+    """
+    Returns the [(key, layer_index), ...] list of patchable layer weights (norms and
+    biases excluded). The list is built once and cached on the model object itself,
+    so every clone sharing the same text encoder skips the key scan, and the cache is
+    released together with the model.
+    """
+    index = getattr(model_obj, "_arthemy_layer_key_index", None)
+    if index is None:
+        index = []
+        for key in model_obj.state_dict():
+            if "norm" in key or "bias" in key:
+                continue
+            idx = _layer_index(key)
+            if idx is not None:
+                index.append((key, idx))
+        model_obj._arthemy_layer_key_index = index
+    return index
+
+
+def _unpatched_weight(patcher, state_dict, key):
+    """
+    Returns the original weight of 'key'. While a previous run is still loaded, the
+    state dict holds its patched weight and ComfyUI keeps the original in
+    patcher.backup: building on the patched weight would stack the tuning.
+    """
+    backup = patcher.backup.get(key)
+    return backup.weight if backup is not None else state_dict[key]
+
+
+def _find_tensor_and_strength(patch):
+    """
+    Unpacks one of ComfyUI's nested list/tuple patch entries in a single pass.
+    Returns the first tensor and the first numeric strength found in depth-first
+    order (or None for either), using an explicit stack instead of recursion.
+    """
+    tensor = None
+    strength = None
+    stack = [patch]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, torch.Tensor):
+            if tensor is None:
+                tensor = item
+        elif isinstance(item, (float, int)):
+            if strength is None:
+                strength = float(item)
+        elif isinstance(item, (list, tuple)):
+            # Reversed, so children are visited in their original order
+            stack.extend(reversed(item))
+        else:
+            continue
+        if tensor is not None and strength is not None:
+            break
+    return tensor, strength
+
+
+def _apply_patches(base, patch_tensors, strengths):
+    """
+    Returns a private FP32 CPU copy of 'base' with all its patches applied:
+    Final = Base + sum(Patch * Strength), accumulated in place in a single buffer.
+    """
+    if not patch_tensors:
+        # Nothing is written, so the (possibly shared) tensor can be returned as is
+        return base.detach().to(device="cpu", dtype=torch.float32)
+
+    # copy=True guarantees a private buffer: patches are accumulated in place
+    # and must never write into the live model weights.
+    weight = base.detach().to(device="cpu", dtype=torch.float32, copy=True)
+    for p_tensor, p_strength in zip(patch_tensors, strengths):
+        p_tensor = p_tensor.to(device="cpu", dtype=torch.float32)
+        # Handle shape broadcasting
+        if p_tensor.shape != weight.shape:
+            try: 
+                p_tensor = p_tensor.view(weight.shape)
+            except: 
+                pass 
+        # Fused in-place multiply-add, no temporary tensors.
+        weight.add_(p_tensor, alpha=p_strength)
+    return weight
+
 
 # ==============================================================================
 # 1. ARTHEMY QWEN TUNER (SIMPLE)
@@ -51,6 +163,8 @@ class ArthemyQwenTunerSimple:
     FUNCTION = "tune_qwen_simple"
     CATEGORY = "Arthemy/Qwen-TE/Tuning"
 
+    # No autograd is involved while collecting patches.
+    @torch.inference_mode()
     def tune_qwen_simple(self, clip, mode, base_strength, **kwargs):
         print(f"--- Arthemy Qwen Simple Tuner Executing (Mode: {mode}) ---")
 
@@ -92,26 +206,26 @@ class ArthemyQwenTunerSimple:
         if hasattr(model_obj, "model"): 
             model_obj = model_obj.model
         
-        current_keys = model_obj.state_dict().keys()
+        # Build the state dict once: state_dict() rebuilds the whole mapping on every call
+        state_dict = model_obj.state_dict()
         active_patches = 0
-
-        # 3. Iterate and Apply Patches
-        for key in current_keys:
-            if "norm" in key or "bias" in key: 
-                continue
-            
-            # Regex to find layer index in standard Qwen structures
-            match = re.search(r"\.layers\.(\d+)\.", key) or re.search(r"\.h\.(\d+)\.", key)
-            if match:
-                idx = int(match.group(1))
-                if idx in layer_scales:
-                    target_scale = layer_scales[idx] * w_base
-                    strength = target_scale - 1.0
-                    
-                    if strength != 0:
-                        original_weight = model_obj.state_dict()[key]
-                        clip_out.add_patches({key: (original_weight,)}, strength, 1.0)
-                        active_patches += 1
+        # Patches grouped by strength, so add_patches runs once per zone value
+        patch_groups = {}
+
+        # 3. Iterate over the cached layer keys and Collect Patches
+        for key, idx in _layer_key_index(model_obj):
+            if idx in layer_scales:
+                target_scale = layer_scales[idx] * w_base
+                strength = target_scale - 1.0
+                
+                if strength != 0:
+                    original_weight = _unpatched_weight(clip_out.patcher, state_dict, key)
+                    patch_groups.setdefault(strength, {})[key] = (original_weight,)
+                    active_patches += 1
+
+        # 4. Apply Patches (one batched call per distinct strength)
+        for strength, patches in patch_groups.items():
+            clip_out.add_patches(patches, strength, 1.0)
 
         info = f"Simple Tuner (6-Zones) Active | Patches: {active_patches}"
         print(f"Update Complete: {info}")
@@ -129,15 +243,12 @@ class ArthemyQwenTunerLab:
     Dynamically generates input fields for surgical precision.
     """
     
-    # Generate Configuration for 36 Layers
-    LAYER_CONFIG = []
-    for i in range(36):
-        if i < 9: prefix = "LLM_Syntax"
-        elif i < 18: prefix = "LLM_Semantics"
-        elif i < 27: prefix = "LLM_Context"
-        else: prefix = "LLM_Abstract"
-        key = f"{prefix}_L{i:02d}"
-        LAYER_CONFIG.append({"index": i, "name": key})
+    # Generate Configuration for 36 Layers as immutable (index, name) pairs
+    # Prefix per group of 9 layers: 00-08 Syntax, 09-17 Semantics, 18-26 Context, 27-35 Abstract
+    LAYER_CONFIG = tuple(
+        (i, f"{('LLM_Syntax', 'LLM_Semantics', 'LLM_Context', 'LLM_Abstract')[i // 9]}_L{i:02d}")
+        for i in range(36)
+    )
 
     @classmethod
     def INPUT_TYPES(s):
@@ -150,8 +261,8 @@ class ArthemyQwenTunerLab:
             "optional": {}
         }
         # Dynamic inputs generation
-        for layer in s.LAYER_CONFIG:
-            inputs["optional"][layer["name"]] = ("FLOAT", {"default": 1.0, "min": 0.0, "max": 2.0, "step": 0.01})
+        for _, name in s.LAYER_CONFIG:
+            inputs["optional"][name] = ("FLOAT", {"default": 1.0, "min": 0.0, "max": 2.0, "step": 0.01})
         return inputs
 
     RETURN_TYPES = ("CLIP", "STRING", "DICT", )
@@ -159,6 +270,7 @@ class ArthemyQwenTunerLab:
     FUNCTION = "tune_qwen_lab"
     CATEGORY = "Arthemy/Qwen-TE/Tuning"
 
+    @torch.inference_mode()
     def tune_qwen_lab(self, clip, mode, base_strength, **kwargs):
         print(f"--- Arthemy Qwen Lab Tuner Executing (Mode: {mode}) ---")
 
@@ -170,16 +282,13 @@ class ArthemyQwenTunerLab:
             return 0.8 + (0.2 * v)
 
         w_base = get_val(base_strength)
-        layer_scales = {}
-        debug_map = {"base_strength": base_strength, "mode": mode, "layers": {}}
+        debug_map = {"base_strength": base_strength, "mode": mode}
         
         # 1. Map User Inputs to Layer Indices
-        for layer in self.LAYER_CONFIG:
-            val = kwargs.get(layer["name"], 1.0)
-            final_val = get_val(val)
-            layer_scales[layer["index"]] = final_val
-            
-            debug_map["layers"][layer["index"]] = (final_val * w_base) - 1.0
+        layer_scales = {idx: get_val(kwargs.get(name, 1.0)) for idx, name in self.LAYER_CONFIG}
+        
+        # Store Expected Strength (Multiplier - 1.0) for validation
+        debug_map["layers"] = {idx: (final_val * w_base) - 1.0 for idx, final_val in layer_scales.items()}
 
         # 2. Clone CLIP (Non-destructive operation)
         clip_out = clip.clone()
@@ -189,28 +298,28 @@ class ArthemyQwenTunerLab:
         if hasattr(model_obj, "model"): 
             model_obj = model_obj.model
         
-        current_keys = model_obj.state_dict().keys()
+        # Build the state dict once: state_dict() rebuilds the whole mapping on every call
+        state_dict = model_obj.state_dict()
         active_patches = 0
-
-        # 4. Iterate and Patch
-        for key in current_keys:
-            if "norm" in key or "bias" in key: 
-                continue
-            
-            # Regex to find layer index
-            match = re.search(r"\.layers\.(\d+)\.", key) or re.search(r"\.h\.(\d+)\.", key)
-            if match:
-                idx = int(match.group(1))
-                if idx in layer_scales:
-                    target_scale = layer_scales[idx] * w_base
-                    strength = target_scale - 1.0
-                    
-                    if strength != 0:
-                        # Lazy Patching: We refer to the original weight in RAM.
-                        # New Weight = Old Weight + (Old Weight * Strength)
-                        original_weight = model_obj.state_dict()[key]
-                        clip_out.add_patches({key: (original_weight,)}, strength, 1.0)
-                        active_patches += 1
+        # Patches grouped by strength, so add_patches runs once per distinct value
+        patch_groups = {}
+
+        # 4. Iterate over the cached layer keys and Collect Patches
+        for key, idx in _layer_key_index(model_obj):
+            if idx in layer_scales:
+                target_scale = layer_scales[idx] * w_base
+                strength = target_scale - 1.0
+                
+                if strength != 0:
+                    # Lazy Patching: We refer to the original weight in RAM.
+                    # New Weight = Old Weight + (Old Weight * Strength)
+                    original_weight = _unpatched_weight(clip_out.patcher, state_dict, key)
+                    patch_groups.setdefault(strength, {})[key] = (original_weight,)
+                    active_patches += 1
+
+        # 5. Apply Patches (one batched call per distinct strength)
+        for strength, patches in patch_groups.items():
+            clip_out.add_patches(patches, strength, 1.0)
 
         info = f"Lab Tuner Active | Patches: {active_patches}"
         print(f"Lab Update Complete: {info}")
@@ -224,7 +333,8 @@ class ArthemyQwenTunerLab:
 class ArthemyQwenSaver:
     """
     Production-ready Saver for Qwen CLIP models.
-    Supports complex nested patch structures via recursive unpacking.
+    Supports complex nested patch structures via iterative unpacking
+    (see _find_tensor_and_strength).
     """
     def __init__(self):
         # CHANGE: Set base output directory to ComfyUI/output/text_encoders
@@ -232,8 +342,7 @@ class ArthemyQwenSaver:
         self.output_dir = os.path.join(base_output, "text_encoders")
         
         # Ensure the directory exists
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
 
     @classmethod
     def INPUT_TYPES(s):
@@ -261,29 +370,11 @@ class ArthemyQwenSaver:
     OUTPUT_NODE = True
     CATEGORY = "Arthemy/Qwen-TE/IO"
 
+    # Export is pure data movement: no autograd bookkeeping on the copies, adds and casts.
+    @torch.inference_mode()
     def save_qwen(self, tuned_clip, original_filename, filename_prefix, save_precision):
         print(f"\n--- Arthemy Saver: Exporting {save_precision} to {filename_prefix}... ---")
         
-        # --- RECURSIVE UNPACKERS ---
-        # Essential for traversing ComfyUI's nested list/tuple structures for patches
-        def find_tensor(data):
-            if isinstance(data, torch.Tensor): return data
-            if isinstance(data, (list, tuple)):
-                for x in data:
-                    res = find_tensor(x)
-                    if res is not None: return res
-            return None
-
-        def find_strength(data):
-            if isinstance(data, (float, int)): return float(data)
-            if isinstance(data, (list, tuple)):
-                for x in data:
-                    if isinstance(x, (float, int)): return float(x)
-                    res = find_strength(x)
-                    if res is not None: return res
-            return None
-        # ---------------------------
-
         # 1. Locate Template File
         # We try 'clip' first, then 'text_encoders'
         template_path = folder_paths.get_full_path("clip", original_filename) or \
@@ -299,61 +390,64 @@ class ArthemyQwenSaver:
             ram_sd = internal_model.state_dict() if not hasattr(internal_model, "model") else internal_model.model.state_dict()
 
             # 2. Suffix Map: Correlate Disk Keys to RAM Keys
-            suffix_map = {}
-            for k in ram_sd.keys():
-                clean_k = k.replace("qwen3_4b.transformer.", "").replace("model.", "")
-                suffix_map[clean_k] = k 
+            suffix_map = {_clean_key(k): k for k in ram_sd}
 
-            final_sd = {}
+            work_items = []
             count_patched = 0
             dtype = torch.float32 if save_precision == "fp32" else torch.float16
 
-            # 3. Read Template and Apply Patches
-            with safetensors.safe_open(template_path, framework="pt", device="cpu") as f:
-                original_keys = f.keys()
-                metadata = f.metadata() if f.metadata() else {}
-                metadata["tuned_by"] = "Arthemy_Unified"
-
-                for orig_key in original_keys:
-                    clean_orig = orig_key.replace("qwen3_4b.transformer.", "").replace("model.", "")
+            # 3. Read Template Header and Collect Patches
+            # Only the key list and metadata are needed from the template, so its
+            # JSON header is parsed directly instead of memory-mapping the whole file.
+            template_header, metadata = read_header(template_path)
+            original_keys = sorted(template_header)
+            clean_orig_keys = [_clean_key(k) for k in original_keys]
+            metadata["tuned_by"] = "Arthemy_Unified"
+
+            for orig_key, clean_orig in zip(original_keys, clean_orig_keys):
+                if clean_orig in suffix_map:
+                    ram_key = suffix_map[clean_orig]
                     
-                    if clean_orig in suffix_map:
-                        ram_key = suffix_map[clean_orig]
-                        # Load base weight
-                        weight = ram_sd[ram_key].to(device="cpu", dtype=torch.float32)
-                        
-                        # Find patches (checking multiple naming conventions)
-                        patches = []
-                        if ram_key in patcher.patches: 
-                            patches = patcher.patches[ram_key]
-                        elif clean_orig in patcher.patches: 
-                            patches = patcher.patches[clean_orig]
-                        
-                        if patches:
-                            for p_data in patches:
-                                # Recursively find the tensor and strength value
-                                p_tensor = find_tensor(p_data)
-                                p_strength = find_strength(p_data)
-                                
-                                if p_tensor is not None and p_strength is not None:
-                                    p_tensor = p_tensor.to(device="cpu", dtype=torch.float32)
-                                    # Handle shape broadcasting
-                                    if p_tensor.shape != weight.shape:
-                                        try: 
-                                            p_tensor = p_tensor.view(weight.shape)
-                                        except: 
-                                            pass 
-                                    
-                                    # Apply Math: Final = Base + (Base * Strength)
-                                    weight = weight + (p_tensor * p_strength)
-                                    count_patched += 1
+                    # Find patches (checking multiple naming conventions)
+                    patches = []
+                    if ram_key in patcher.patches: 
+                        patches = patcher.patches[ram_key]
+                    elif clean_orig in patcher.patches: 
+                        patches = patcher.patches[clean_orig]
+                    
+                    # Collect every patch of this key first, then apply them in one pass
+                    p_tensors = []
+                    p_strengths = []
+                    for p_data in patches:
+                        # Find the tensor and strength value inside ComfyUI's nested patch structure
+                        p_tensor, p_strength = _find_tensor_and_strength(p_data)
                         
-                        final_sd[orig_key] = weight.to(dtype)
-
-            # 4. Write File
+                        if p_tensor is not None and p_strength is not None:
+                            p_tensors.append(p_tensor)
+                            p_strengths.append(p_strength)
+                    
+                    base = _unpatched_weight(patcher, ram_sd, ram_key)
+                    work_items.append((orig_key, base, p_tensors, p_strengths))
+                    count_patched += len(p_tensors)
+
+            # 4. Apply Patches in Parallel
+            # Every key is independent and ATen kernels release the GIL,
+            # so the copy/add/cast work spreads across a few worker threads.
+            # inference_mode is thread-local, so the worker function enters it too.
+            @torch.inference_mode()
+            def process_one(item):
+                orig_key, base, p_tensors, p_strengths = item
+                # Apply Math: Final = Base + (Base * Strength)
+                return orig_key, _apply_patches(base, p_tensors, p_strengths).to(dtype)
+
+            # 5. Stream File
+            # The header is planned from the RAM shapes, then each patched tensor is
+            # written as soon as it is ready: peak RAM stays at 2 * STREAM_WORKERS
+            # FP32 tensors (at most 8) instead of a full copy of the text encoder.
             # Uses the directory set in __init__ (output/text_encoders)
             out_path = os.path.join(self.output_dir, f"{filename_prefix}.safetensors")
-            save_file(final_sd, out_path, metadata=metadata)
+            specs = [(orig_key, base.shape, dtype) for orig_key, base, _, _ in work_items]
+            save_file_streamed(out_path, specs, map_in_order(process_one, work_items), metadata=metadata)
             
             print(f"Export successful: {out_path}")
             print(f"Total Patches Applied: {count_patched}")
@@ -1,8 +1,89 @@
+import abc
 import torch
 import folder_paths
 import os
+import re
 import comfy.sd
 import comfy.utils
+import comfy.model_management
+import comfy.patcher_extension
+from .arthemy_safetensors_io import save_file_streamed, map_in_order
+
+# Options for the tuners' 'compile_model' input ("disabled" keeps eager execution)
+COMPILE_MODES = ["disabled", "default", "max-autotune"]
+
+# Matches main transformer layer keys ("layers.N. ...") and captures the layer index
+_LAYER_RE = re.compile(r"^layers\.(\d+)\.")
+
+# Key of the tuners' APPLY_MODEL wrapper (a later tuner replaces an earlier one's)
+_COMPILE_WRAPPER_KEY = "arthemy_tuner_compile"
+
+
+def _compiled_apply_model(compiled):
+    """
+    APPLY_MODEL wrapper that swaps the compiled backbone in for the duration of a
+    single model call. Outside of sampling the shared BaseModel keeps its plain
+    diffusion_model, so its state_dict keys (used by add_patches) never change.
+    """
+    def wrapper(executor, *args, **kwargs):
+        original = comfy.utils.set_attr(executor.class_obj, "diffusion_model", compiled)
+        try:
+            return executor(*args, **kwargs)
+        finally:
+            comfy.utils.set_attr(executor.class_obj, "diffusion_model", original)
+    return wrapper
+
+
+def _compile_backbone(model_clone, compile_mode, cache):
+    """
+    Runs the clone's diffusion_model through a torch.compile'd wrapper while sampling.
+
+    The wrapper is kept in 'cache' (keyed by backbone identity) and reused while the
+    backbone and mode are unchanged: the tuners only change weight values, which the
+    compiled graph reads at run time, so moving a slider never triggers a recompile.
+    """
+    if compile_mode == "disabled":
+        # Drop the cached wrapper, so the node doesn't pin a backbone it no longer compiles
+        cache.clear()
+        return
+
+    backbone = model_clone.get_model_object("diffusion_model")
+    # Never compile an already compiled module (e.g. one installed by another node)
+    backbone = getattr(backbone, "_orig_mod", backbone)
+    model_id = id(backbone)
+    cached = cache.get(model_id)
+    if cached is None or cached[0] != compile_mode or cached[1]._orig_mod is not backbone:
+        # Only the current backbone is kept, so switching models doesn't pin old ones in memory
+        cache.clear()
+        print(f"--- Arthemy Tuner: Compiling diffusion model (Mode: {compile_mode}) ---")
+        cached = (compile_mode, torch.compile(backbone, mode=compile_mode))
+        cache[model_id] = cached
+
+    apply_model = comfy.patcher_extension.WrappersMP.APPLY_MODEL
+    model_clone.remove_wrappers_with_key(apply_model, _COMPILE_WRAPPER_KEY)
+    model_clone.add_wrapper_with_key(apply_model, _COMPILE_WRAPPER_KEY, _compiled_apply_model(cached[1]))
+
+
+def _tuner_key_index(internal_model):
+    """
+    Returns the [(key, layer_index, is_norm), ...] list of tunable weights and biases,
+    with layer_index None for keys outside the main layers. The list is built once and
+    cached on the diffusion model itself, so every clone sharing the same backbone skips
+    the key scan. Only names are cached: ComfyUI swaps the Parameter objects when it
+    patches weights.
+    """
+    index = getattr(internal_model, "_arthemy_tuner_key_index", None)
+    if index is None:
+        index = []
+        for key, _ in internal_model.named_parameters():
+            if "weight" not in key and "bias" not in key:
+                continue
+            match = _LAYER_RE.match(key)
+            idx = int(match.group(1)) if match else None
+            is_norm = ("norm" in key) or ("adaLN" in key)
+            index.append((key, idx, is_norm))
+        internal_model._arthemy_tuner_key_index = index
+    return index
 
 # ==============================================================================
 # 1. ARTHEMY TUNER LOADER
@@ -66,22 +147,145 @@ class ArthemyTunerLoader:
 
 
 # ==============================================================================
-# 2. ARTHEMY Z-IMAGE TUNER (SIMPLE)
+# 2. ARTHEMY Z-IMAGE TUNER BASE
+# Description: Shared scaling pipeline for the Simple and LAB tuners.
+# ==============================================================================
+class _ArthemyZImageTunerBase(abc.ABC):
+    """
+    Common implementation behind the Z-Image Tuners.
+
+    Technical Logic:
+    - Iterates through the model's weights and biases (cached by _tuner_key_index).
+    - Skips normalization layers unless explicitly unlocked.
+    - Asks the subclass for the multiplier of each main layer key (_layer_scale)
+      and of each auxiliary key (_component_scale).
+      Subclasses keep per-layer values in a 'layers' list indexed by layer (0-29).
+    - Registers the multipliers as ModelPatcher patches on the clone, one
+      add_patches call per distinct value. ComfyUI applies them when the model
+      is loaded, so the cached base model is never modified.
+
+    Subclasses only describe how their sliders map to multipliers.
+    """
+    # Prefix of the completion message printed after each run
+    DONE_MESSAGE = "Update Complete"
+
+    def __init__(self):
+        # Compiled backbone reused across slider changes (see _compile_backbone)
+        self._compiled_for = {}
+
+    @staticmethod
+    def _get_val(v, mode, base_strength):
+        # Calculates the actual multiplier based on mode selection.
+        if mode == "Real Value":
+            return v * base_strength
+        # Soft Value Mode:
+        # Compresses the dynamic range to prevent model collapse.
+        # Logic: 1.0 + (Input - 1.0) * 0.2
+        return 1.0 + ((v - 1.0) * 0.2)
+
+    @staticmethod
+    def _is_passthrough(scales):
+        # True when every multiplier (including per-layer tables) is exactly 1.0
+        for v in scales.values():
+            values = v if isinstance(v, list) else (v,)
+            if any(s != 1.0 for s in values):
+                return False
+        return True
+
+    @abc.abstractmethod
+    def _layer_scale(self, key, idx, scales):
+        """Multiplier for a key of main layer 'idx', or None to leave it untouched."""
+
+    @abc.abstractmethod
+    def _component_scale(self, key, scales):
+        """Multiplier for a key outside the main layers, or None to leave it untouched."""
+
+    # The tuner never takes part in autograd: inference_mode skips the version
+    # counter bumps and view tracking of the parameter walk.
+    @torch.inference_mode()
+    def _apply_tuning(self, model, scales, unsafe_tune_normalization, compile_model):
+        # Passthrough: with every slider at identity there is nothing to scale,
+        # so the parameter walk (and even the clone, unless compiling) is skipped.
+        if self._is_passthrough(scales):
+            print(f"{self.DONE_MESSAGE}: Passthrough, all multipliers are 1.0.")
+            if compile_model == "disabled":
+                self._compiled_for.clear()
+                return (model,)
+            model_clone = model.clone()
+            _compile_backbone(model_clone, compile_model, self._compiled_for)
+            return (model_clone,)
+
+        # Clone model: the patches live on the clone, the original cached object is shared untouched
+        model_clone = model.clone()
+        # Unwrap a backbone compiled through an object patch so keys keep their plain names
+        backbone = model_clone.get_model_object("diffusion_model")
+        internal_model = getattr(backbone, "_orig_mod", backbone)
+
+        patch_groups = {}
+        queued = 0
+        skipped_norm = 0
+
+        for key, idx, is_norm_layer in _tuner_key_index(internal_model):
+            # Normalization Layer Protection
+            # Modifying norms often leads to image artifacts. We skip them unless explicitly overridden.
+            if is_norm_layer and not unsafe_tune_normalization:
+                skipped_norm += 1
+                continue
+
+            scale = None
+
+            # Main Transformer Layers (Indices 0-29)
+            if idx is not None:
+                scale = self._layer_scale(key, idx, scales)
+
+            # Embedders, Refiners and Final Output Layer
+            else:
+                scale = self._component_scale(key, scales)
+
+            # Queue Patch, grouped by multiplier
+            # We use a threshold (1e-4) to avoid unnecessary operations for identity values (1.0).
+            if scale is not None and abs(scale - 1.0) > 1e-4:
+                full_key = "diffusion_model." + key
+                # While a previous run is still loaded, the live Parameter holds its patched
+                # weight and the original sits in 'backup'. Reference the original, so the
+                # patch never keeps an extra copy of a patched weight alive.
+                backup = model_clone.backup.get(full_key)
+                tensor = backup.weight if backup is not None else internal_model.get_parameter(key)
+                patch_groups.setdefault(scale, {})[full_key] = (tensor.detach(),)
+                queued += 1
+
+        # Apply Lazy Patches
+        # Patch strength 0.0 disables the diff term and strength_model scales the weight,
+        # so ComfyUI computes "Weight * Scale" at load time. The stored tensor is never
+        # read, so the result stays exact whatever weights the shared model holds.
+        # add_patches rebuilds the model state_dict on every call, so call it once per value.
+        # It returns the keys it accepted: the count reports what was actually patched.
+        count = 0
+        for scale, patches in patch_groups.items():
+            count += len(model_clone.add_patches(patches, 0.0, scale))
+
+        print(f"{self.DONE_MESSAGE}: Patched {count} tensors. Skipped {skipped_norm} normalization layers.")
+        if count < queued:
+            print(f"Warning: {queued - count} tensors were not found in the model and were left untouched.")
+        _compile_backbone(model_clone, compile_model, self._compiled_for)
+        return (model_clone,)
+
+
+# ==============================================================================
+# 3. ARTHEMY Z-IMAGE TUNER (SIMPLE)
 # Description: Applies scaling factors to model weights using semantic blocks.
 # ==============================================================================
-class ArthemyZImage_Tuner_Simple:
+class ArthemyZImage_Tuner_Simple(_ArthemyZImageTunerBase):
     """
     Modifies the weights of a Diffusion Model by grouping layers into 6 semantic blocks.
     
     Technical Logic:
-    - Iterates through the model's state_dict.
-    - Identifies layers by index (0-29).
-    - Multiplies weight tensors by a scalar value derived from user inputs.
+    - Identifies layers by index (0-29) and assigns each 5-layer block its own multiplier.
+    - Applies global Attention / MLP multipliers on top of the block value.
     - Provides a 'Soft Value' mode which maps a 0.0-2.0 input range to a 
       conservative deviation from 1.0 (identity).
+    - Optionally returns the model wrapped with torch.compile for faster sampling.
     """
-    def __init__(self):
-        pass
 
     @classmethod
     def INPUT_TYPES(s):
@@ -110,6 +314,9 @@ class ArthemyZImage_Tuner_Simple:
                 
                 # --- Normalization Handling ---
                 "unsafe_tune_normalization": ("BOOLEAN", {"default": False, "label_on": "Tune Norms (Unstable)", "label_off": "Lock Norms (Stable)"}),
+
+                # --- Inference Speed ---
+                "compile_model": (COMPILE_MODES, {"default": "disabled"}),
             }
         }
 
@@ -119,25 +326,13 @@ class ArthemyZImage_Tuner_Simple:
 
     def tune(self, model, mode, base_strength, block_1_start_00_04, block_2_early_05_09, block_3_mid_10_14, 
              block_4_core_15_19, block_5_late_20_24, block_6_end_25_29,
-             global_attention, global_mlp, embedders_strength, refiners_strength, unsafe_tune_normalization):
+             global_attention, global_mlp, embedders_strength, refiners_strength, unsafe_tune_normalization,
+             compile_model="disabled"):
         
         print(f"--- Arthemy Simple Tuner Executing (Mode: {mode}) ---")
         
-        # Helper: Calculates the actual multiplier based on mode selection.
-        def get_val(v):
-            if mode == "Real Value": 
-                return v
-            # Soft Value Mode:
-            # Compresses the dynamic range to prevent model collapse.
-            # Logic: 1.0 + (Input - 1.0) * 0.2
-            return 1.0 + ((v - 1.0) * 0.2)
-
-        # Helper: Applies base_strength logic.
         def calc_final(val):
-            v = get_val(val)
-            if mode == "Real Value": 
-                v = v * base_strength
-            return v
+            return self._get_val(val, mode, base_strength)
 
         # Map inputs to a dictionary for easier access during iteration
         params = {
@@ -152,94 +347,53 @@ class ArthemyZImage_Tuner_Simple:
             "emb": calc_final(embedders_strength),
             "ref": calc_final(refiners_strength)
         }
-
-        # Clone model to prevent modifying the original cached object in memory
-        model_clone = model.clone()
-        internal_model = model_clone.model.diffusion_model
-        state_dict = internal_model.state_dict()
-        
-        count = 0
-        skipped_norm = 0
-        
-        for key, tensor in state_dict.items():
-            if "weight" not in key and "bias" not in key: 
-                continue
-            
-            # Normalization Layer Protection
-            # Modifying norms often leads to image artifacts. We skip them unless explicitly overridden.
-            is_norm_layer = ("norm" in key) or ("adaLN" in key)
-            if is_norm_layer and not unsafe_tune_normalization:
-                skipped_norm += 1
-                continue
-
-            scale = 1.0
-            is_target = False
-            
-            # Logic 1: Handle Main Transformer/Unet Layers (Indices 0-29)
-            if key.startswith("layers."):
-                try:
-                    parts = key.split(".")
-                    idx = int(parts[1])
-                    is_target = True
-                    
-                    # Assign Block Multiplier
-                    if   0 <= idx <= 4:  scale = params["b1"]
-                    elif 5 <= idx <= 9:  scale = params["b2"]
-                    elif 10 <= idx <= 14: scale = params["b3"]
-                    elif 15 <= idx <= 19: scale = params["b4"]
-                    elif 20 <= idx <= 24: scale = params["b5"]
-                    elif 25 <= idx <= 29: scale = params["b6"]
-                    
-                    # Apply Global Component Multipliers (Attention vs MLP)
-                    if "attention" in key: 
-                        scale *= params["g_att"]
-                    elif "feed_forward" in key: 
-                        scale *= params["g_mlp"]
-                except: 
-                    pass
-
-            # Logic 2: Handle Embedders
-            elif "embedder" in key:
-                scale = params["emb"]
-                is_target = True
-
-            # Logic 3: Handle Refiners
-            elif "refiner" in key:
-                scale = params["ref"]
-                is_target = True
-            
-            # Logic 4: Handle Final Output Layer
-            elif "final_layer" in key:
-                scale = params["b6"]
-                is_target = True
-
-            # Apply In-Place Multiplication
-            # We use a threshold (1e-4) to avoid unnecessary operations for identity values (1.0).
-            if is_target and abs(scale - 1.0) > 1e-4:
-                tensor.mul_(scale)
-                count += 1
-
-        print(f"Update Complete: Modified {count} tensors. Skipped {skipped_norm} normalization layers.")
-        return (model_clone,)
+        # Block multiplier of every layer index, precomputed so the key scan is a list lookup
+        params["layers"] = ([params["b1"]] * 5 + [params["b2"]] * 5 + [params["b3"]] * 5 +
+                            [params["b4"]] * 5 + [params["b5"]] * 5 + [params["b6"]] * 5)
+
+        return self._apply_tuning(model, params, unsafe_tune_normalization, compile_model)
+
+    def _layer_scale(self, key, idx, params):
+        # Assign Block Multiplier
+        layers = params["layers"]
+        scale = layers[idx] if idx < len(layers) else 1.0
+
+        # Apply Global Component Multipliers (Attention vs MLP)
+        if "attention" in key: 
+            scale *= params["g_att"]
+        elif "feed_forward" in key: 
+            scale *= params["g_mlp"]
+        return scale
+
+    def _component_scale(self, key, params):
+        # Embedders
+        if "embedder" in key:
+            return params["emb"]
+        # Refiners
+        if "refiner" in key:
+            return params["ref"]
+        # Final Output Layer
+        if "final_layer" in key:
+            return params["b6"]
+        return None
 
 
 # ==============================================================================
-# 3. ARTHEMY Z-IMAGE TUNER (LAB)
+# 4. ARTHEMY Z-IMAGE TUNER (LAB)
 # Description: Provides granular access to individual layers (0-29).
 # ==============================================================================
-class ArthemyZImage_Tuner_Lab:
+class ArthemyZImage_Tuner_Lab(_ArthemyZImageTunerBase):
     """
     Advanced Tuner allowing per-layer weight scaling.
     Dynamically generates input fields for all 30 standard layers found in SD/Flux architectures.
     """
     
-    # Configuration for dynamic input generation
-    LAYER_CONFIG = []
-    for i in range(30):
-        LAYER_CONFIG.append({"index": i, "name": f"Layer_{i:02d}"})
+    DONE_MESSAGE = "Lab Update Complete"
 
-    def __init__(self):
-        pass
+    # Configuration for dynamic input generation, as immutable (index, name) pairs
+    LAYER_CONFIG = tuple((i, f"Layer_{i:02d}") for i in range(30))
+    # Slider names in layer order (index 0-29)
+    _LAYER_NAMES = tuple(name for _, name in LAYER_CONFIG)
 
     @classmethod
     def INPUT_TYPES(s):
@@ -258,8 +412,11 @@ class ArthemyZImage_Tuner_Lab:
         }
         
         # Programmatically add inputs for Layer 00 through Layer 29
-        for layer in s.LAYER_CONFIG:
-            inputs["optional"][layer["name"]] = ("FLOAT", {"default": 1.0, "min": 0.0, "max": 10.0, "step": 0.01})
+        for _, name in s.LAYER_CONFIG:
+            inputs["optional"][name] = ("FLOAT", {"default": 1.0, "min": 0.0, "max": 10.0, "step": 0.01})
+
+        # Added last: saved workflows restore widget values by position
+        inputs["optional"]["compile_model"] = (COMPILE_MODES, {"default": "disabled"})
             
         return inputs
 
@@ -267,85 +424,46 @@ class ArthemyZImage_Tuner_Lab:
     FUNCTION = "tune_lab"
     CATEGORY = "Arthemy/Z-Image/Tuning"
 
-    def tune_lab(self, model, mode, base_strength, unsafe_tune_normalization, **kwargs):
+    def tune_lab(self, model, mode, base_strength, unsafe_tune_normalization, compile_model="disabled", **kwargs):
         print(f"--- Arthemy Lab Tuner Executing (Mode: {mode}) ---")
         
         def get_val(v):
-            if mode == "Real Value": 
-                return v * base_strength
-            return 1.0 + ((v - 1.0) * 0.2)
+            return self._get_val(v, mode, base_strength)
 
         # 1. Parse Dynamic Inputs
-        layer_scales = {}
-        for layer in self.LAYER_CONFIG:
-            user_val = kwargs.get(layer["name"], 1.0)
-            layer_scales[layer["index"]] = get_val(user_val)
+        layer_scales = [get_val(kwargs.get(name, 1.0)) for name in self._LAYER_NAMES]
 
-        val_noise = get_val(kwargs.get("Noise_Refiners", 1.0))
-        val_context = get_val(kwargs.get("Context_Refiners", 1.0))
-        val_embed = get_val(kwargs.get("Embedders_Global", 1.0))
+        scales = {
+            "layers": layer_scales,
+            "noise": get_val(kwargs.get("Noise_Refiners", 1.0)),
+            "context": get_val(kwargs.get("Context_Refiners", 1.0)),
+            "embed": get_val(kwargs.get("Embedders_Global", 1.0)),
+        }
 
-        # 2. Clone and Iterate Model State
-        model_clone = model.clone()
-        internal_model = model_clone.model.diffusion_model
-        state_dict = internal_model.state_dict()
-        
-        count = 0
-        skipped_norm = 0
-        
-        for key, tensor in state_dict.items():
-            if "weight" not in key and "bias" not in key: 
-                continue
-            
-            # Check Normalization Constraints
-            is_norm_layer = ("norm" in key) or ("adaLN" in key)
-            if is_norm_layer and not unsafe_tune_normalization:
-                skipped_norm += 1
-                continue
+        # 2. Clone and Scale Model State
+        return self._apply_tuning(model, scales, unsafe_tune_normalization, compile_model)
 
-            scale = 1.0
-            is_target = False
-            
-            # Apply Per-Layer logic
-            if key.startswith("layers."):
-                try:
-                    parts = key.split(".")
-                    idx = int(parts[1])
-                    if idx in layer_scales:
-                        scale = layer_scales[idx]
-                        is_target = True
-                except: 
-                    pass
-            
-            # Apply Specific Component logic
-            elif "noise_refiner" in key:
-                scale = val_noise
-                is_target = True
-                
-            elif "context_refiner" in key:
-                scale = val_context
-                is_target = True
-                
-            elif "embedder" in key:
-                scale = val_embed
-                is_target = True
-
-            elif "final_layer" in key:
-                # The final layer typically correlates with the exit flow of the last main layer (29)
-                scale = layer_scales.get(29, 1.0)
-                is_target = True
-
-            # Execute Modification
-            if is_target and abs(scale - 1.0) > 1e-4:
-                tensor.mul_(scale)
-                count += 1
-                
-        print(f"Lab Update Complete: Modified {count} tensors. Skipped {skipped_norm} normalization layers.")
-        return (model_clone,)
+    def _layer_scale(self, key, idx, scales):
+        # Apply Per-Layer logic
+        layers = scales["layers"]
+        return layers[idx] if idx < len(layers) else None
+
+    def _component_scale(self, key, scales):
+        # Apply Specific Component logic
+        if "noise_refiner" in key:
+            return scales["noise"]
+        if "context_refiner" in key:
+            return scales["context"]
+        if "embedder" in key:
+            return scales["embed"]
+        if "final_layer" in key:
+            # The final layer typically correlates with the exit flow of the last main layer (29)
+            return scales["layers"][29]
+        return None
 
 
 # ==============================================================================
-# 4. ARTHEMY Z-IMAGE SAVER
+# 5. ARTHEMY Z-IMAGE SAVER
 # Description: Serializes the modified model state to disk as a Safetensors file.
 # ==============================================================================
 class ArthemyZImage_Saver:
@@ -355,8 +473,7 @@ class ArthemyZImage_Saver:
         self.output_dir = os.path.join(base_output, "diffusion_models")
         
         # Ensure the directory exists
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
 
     @classmethod
     def INPUT_TYPES(s):
@@ -376,6 +493,11 @@ class ArthemyZImage_Saver:
     FUNCTION = "save"
     CATEGORY = "Arthemy/Z-Image/IO"
 
+    # Target dtype for each 'save_precision' option
+    SAVE_DTYPES = {"fp16": torch.float16, "bf16": torch.bfloat16, "float32": torch.float32}
+
+    # Export is pure data movement: no autograd bookkeeping on the transfers and casts.
+    @torch.inference_mode()
     def save(self, model, filename_prefix, save_precision):
         # CHANGE: Use the pre-calculated directory from __init__
         filename = f"{filename_prefix}.safetensors"
@@ -383,24 +505,30 @@ class ArthemyZImage_Saver:
         
         print(f"--- Arthemy Saver: Exporting {save_precision} to {filename}... ---")
         try:
+            # The tuners only attach patches: load the model with its patches baked
+            # into the weights so the export contains the tuned values.
+            comfy.model_management.load_models_gpu([model], force_patch_weights=True)
             internal_model = model.model.diffusion_model
-            state_dict = internal_model.state_dict()
+            # A compiled backbone wraps the real module; save its plain keys
+            internal_model = getattr(internal_model, "_orig_mod", internal_model)
+            target_dtype = self.SAVE_DTYPES[save_precision]
             
             # Prepare state dict for saving (CPU transfer and casting)
-            clean_dict = {}
-            for k, v in state_dict.items():
-                if v is not None:
-                    t = v.to("cpu").contiguous()
-                    if save_precision == "fp16": 
-                        t = t.half()
-                    elif save_precision == "float32": 
-                        t = t.float()
-                    elif save_precision == "bf16": 
-                        t = t.bfloat16()
-                    clean_dict[k] = t
-            
-            import safetensors.torch
-            safetensors.torch.save_file(clean_dict, full_path)
+            # Transfer and cast happen in a single .to() per tensor, so no intermediate
+            # full-size copy in the source precision is ever held in RAM.
+            # inference_mode is thread-local, so the worker function enters it too.
+            @torch.inference_mode()
+            def prepare(item):
+                k, v = item
+                return k, v.detach().to("cpu", dtype=target_dtype).contiguous()
+
+            # Tensors are independent and ATen kernels release the GIL: cast them on a few
+            # threads, and stream each one to disk as soon as it is ready instead of building
+            # the whole converted state dict in RAM first (at most 2 * STREAM_WORKERS,
+            # i.e. 8, converted tensors are held at once).
+            items = [(k, v) for k, v in internal_model.state_dict().items() if v is not None]
+            specs = [(k, v.shape, target_dtype) for k, v in items]
+            save_file_streamed(full_path, specs, map_in_order(prepare, items))
             print(f"Export successful: {full_path}")
         except Exception as e:
             print(f"Export failed: {e}")